@@ -0,0 +1,115 @@
+"""Бенчмарк сериализации и сжатия крупных ответов API.
+
+Сравнивает стандартный json (как в JSONResponse) и orjson (ORJSONResponse)
+по времени кодирования и размеру ответа без сжатия, с gzip и с brotli
+на синтетических данных масштаба класса и школы.
+
+Запуск: python benchmarks/bench_serialization.py
+"""
+import gzip
+import json
+import random
+import timeit
+from datetime import datetime, timedelta
+
+import orjson
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SUBJECTS = ["Математика", "Литература", "Физика", "Химия", "История", "География", "Биология", "Английский язык"]
+CLASSES = ["9A", "9B", "10A", "10B", "11A", "11B"]
+GZIP_COMPRESS_LEVEL = 5
+BROTLI_QUALITY = 4
+
+# (название, количество учеников, оценок на ученика)
+SCALES = [
+    ("class", 30, 40),
+    ("school", 1500, 40),
+]
+
+
+def make_students(count):
+    return [
+        {"id": i, "name": f"Ученик {i} Фамилия{i}", "class_name": CLASSES[i % len(CLASSES)]}
+        for i in range(1, count + 1)
+    ]
+
+
+def make_grade_history(grades_per_student):
+    """Ответ вида /grades/{id} и мутаций оценок: оценки, сгруппированные по предметам."""
+    start = datetime(2024, 9, 1)
+    grouped = {}
+    for i in range(grades_per_student):
+        subject = SUBJECTS[i % len(SUBJECTS)]
+        grouped.setdefault(subject, []).append({
+            "id": i + 1,
+            "score": random.randint(2, 5),
+            "date": (start + timedelta(days=i, minutes=i)).isoformat(),
+            "teacher_id": 1
+        })
+    return {"message": "Grade added successfully", "grades": grouped}
+
+
+def make_gradebook(count):
+    """Ответ вида /gradebook: колоночная матрица ученики x предметы."""
+    return {
+        "class_name": None,
+        "subjects": SUBJECTS,
+        "student_ids": list(range(1, count + 1)),
+        "student_names": [f"Ученик {i} Фамилия{i}" for i in range(1, count + 1)],
+        "scores": [[round(random.uniform(2, 5), 2) for _ in SUBJECTS] for _ in range(count)],
+        "counts": [[random.randint(1, 10) for _ in SUBJECTS] for _ in range(count)],
+        "averages": [round(random.uniform(2, 5), 2) for _ in range(count)]
+    }
+
+
+def make_nested_gradebook(count, grades_per_student):
+    """Альтернатива /gradebook: истории оценок всех учеников вложенными словарями."""
+    return {str(i): make_grade_history(grades_per_student)["grades"] for i in range(1, count + 1)}
+
+
+def encode_json(payload):
+    # Параметры как у starlette.responses.JSONResponse
+    return json.dumps(payload, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def encode_orjson(payload):
+    return orjson.dumps(payload)
+
+
+def measure(func, payload, repeat=5):
+    number = max(1, int(0.2 / max(timeit.timeit(lambda: func(payload), number=1), 1e-6)))
+    best = min(timeit.repeat(lambda: func(payload), number=number, repeat=repeat)) / number
+    return best * 1000
+
+
+def main():
+    random.seed(42)
+    print(f"{'payload':<28}{'json ms':>10}{'orjson ms':>11}{'raw B':>11}{'gzip B':>10}{'br B':>10}{'gzip ms':>9}{'br ms':>8}")
+    for scale, students, grades_per_student in SCALES:
+        payloads = {
+            "students": make_students(students),
+            "grade_history": make_grade_history(grades_per_student),
+            "gradebook": make_gradebook(students),
+            "nested_histories": make_nested_gradebook(students, grades_per_student),
+        }
+        for name, payload in payloads.items():
+            body = encode_orjson(payload)
+            json_ms = measure(encode_json, payload)
+            orjson_ms = measure(encode_orjson, payload)
+            # Уровни сжатия как в main.py: GZIP_COMPRESS_LEVEL и BROTLI_QUALITY
+            gzip_size = len(gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL))
+            gzip_ms = measure(lambda b: gzip.compress(b, compresslevel=GZIP_COMPRESS_LEVEL), body, repeat=3)
+            if brotli is not None:
+                br_size = str(len(brotli.compress(body, quality=BROTLI_QUALITY)))
+                br_ms = f"{measure(lambda b: brotli.compress(b, quality=BROTLI_QUALITY), body, repeat=3):.2f}"
+            else:
+                br_size = br_ms = "n/a"
+            print(f"{scale + '/' + name:<28}{json_ms:>10.3f}{orjson_ms:>11.3f}{len(body):>11}{gzip_size:>10}{br_size:>10}{gzip_ms:>9.2f}{br_ms:>8}")
+
+
+if __name__ == "__main__":
+    main()
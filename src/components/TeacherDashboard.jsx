@@ -215,10 +215,27 @@ function TeacherDashboard({ token }) {
       return;
     }
     setIsGenerating(true);
+    const saveBlob = (blob) => {
+      const url = window.URL.createObjectURL(blob);
+      const link = document.createElement('a');
+      link.href = url;
+      link.setAttribute('download', `отчет_${selectedStudentId}.pdf`);
+      document.body.appendChild(link);
+      link.click();
+      link.remove();
+      window.URL.revokeObjectURL(url);
+    };
     try {
+      // Небольшие отчеты сервер отдает сразу в ответе, большие генерирует в фоне
       const generateResponse = await axios.get(`http://localhost:8000/generate-report/${selectedStudentId}`, {
         headers: { Authorization: `Bearer ${token}` },
+        params: { stream: true },
+        responseType: 'blob',
       });
+      if (generateResponse.headers['content-type']?.includes('application/pdf')) {
+        saveBlob(generateResponse.data);
+        return;
+      }
       let attempts = 0;
       const maxAttempts = 10;
       while (attempts < maxAttempts) {
@@ -227,15 +244,7 @@ function TeacherDashboard({ token }) {
             headers: { Authorization: `Bearer ${token}` },
             responseType: 'blob',
           });
-          const url = window.URL.createObjectURL(new Blob([downloadResponse.data]));
-          const link = document.createElement('a');
-          link.href = url;
-          link.setAttribute('download', `отчет_${selectedStudentId}.pdf`);
-          document.body.appendChild(link);
-          link.click();
-          link.remove();
-          window.URL.revokeObjectURL(url);
-          setIsGenerating(false);
+          saveBlob(new Blob([downloadResponse.data]));
           return;
         } catch (downloadError) {
           if (downloadError.response?.status === 404) {
@@ -248,7 +257,15 @@ function TeacherDashboard({ token }) {
       }
       alert('Отчет не был сгенерирован в течение заданного времени');
     } catch (error) {
-      alert('Ошибка генерации отчета: ' + (error.response?.data?.detail || error.message));
+      let detail = error.response?.data?.detail;
+      if (error.response?.data instanceof Blob) {
+        try {
+          detail = JSON.parse(await error.response.data.text()).detail;
+        } catch {
+          detail = undefined;
+        }
+      }
+      alert('Ошибка генерации отчета: ' + (detail || error.message));
     } finally {
       setIsGenerating(false);
     }